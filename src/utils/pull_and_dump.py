@@ -4,13 +4,185 @@ from sqlalchemy import create_engine, URL
 import snowflake.connector
 from snowflake.connector.pandas_tools import write_pandas
 import os
+import atexit
+import functools
+import threading
+import io
+import csv
+import gzip
+import tempfile
 import argparse
-import requests
+import asyncio
+import concurrent.futures
+import httpx
+import orjson
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from dotenv import load_dotenv
 
 load_dotenv()
 
+BASE_URL = "https://api.collegefootballdata.com/"
+
+CACHE_NAME = os.getenv("CFBD_CACHE", "cfbd_cache")
+
+_SESSION = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Return the shared requests Session used for API calls, creating it on first use.
+
+    Returns:
+    - session (requests_cache.CachedSession): The module-level Session, reused across calls so that
+      connections to the API are kept alive instead of re-established on every request.
+
+    Responses are cached on disk in the sqlite database named by CACHE_NAME (the CFBD_CACHE
+    environment variable, defaulting to cfbd_cache.sqlite in the working directory) for an hour,
+    or as long as the API's Cache-Control headers allow. Once expired, they are revalidated with
+    If-None-Match using the stored ETag, so an unchanged endpoint costs a 304 response instead of
+    the full payload.
+
+    Example:
+    ```python
+    # Mount a custom adapter on the shared session
+    get_session().mount("https://", HTTPAdapter(pool_maxsize=20))
+    ```
+    """
+
+    global _SESSION
+    with _session_lock:
+        if _SESSION is None:
+            _SESSION = requests_cache.CachedSession(
+                CACHE_NAME, backend="sqlite", cache_control=True, expire_after=3600
+            )
+            _SESSION.mount(
+                "https://",
+                HTTPAdapter(
+                    pool_connections=10,
+                    pool_maxsize=10,
+                    max_retries=Retry(
+                        total=3,
+                        backoff_factor=0.3,
+                        status_forcelist=[429, 500, 502, 503, 504],
+                        raise_on_status=False,
+                    ),
+                ),
+            )
+        return _SESSION
+
+
+def _headers(api_key):
+    """
+    Build the request headers for the College Football Data API.
+
+    Responses are requested gzip or brotli compressed; both requests and httpx decode them
+    transparently (brotli needs the brotli package installed).
+    """
+
+    return {
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip, br",
+        "Authorization": f"Bearer {api_key}",
+    }
+
+
+def _get_json(url, api_key, params, timeout=120):
+    """
+    Make a GET request to an API endpoint through the shared session and decode the JSON body.
+
+    Parameters:
+    - url (str): The URL of the API endpoint.
+    - api_key (str): The API key to use for authentication.
+    - params (dict): A dictionary containing the parameters to be passed to the API.
+    - timeout (int): The timeout in seconds for the API request.
+
+    Returns:
+    - payload (list or dict): The decoded JSON response, parsed with orjson.
+
+    The cached session (see get_session) reads the whole response body in order to store it, so
+    the body is decoded from response.content in one call. If the request is not successful (any
+    status outside 2xx) a requests.HTTPError is raised; 429 and 5xx responses are retried by the
+    session first and raise the same error once retries run out.
+    """
+
+    response = get_session().get(
+        url, headers=_headers(api_key), params=params, timeout=timeout
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+def pull_records_from_api(url, api_key, params, timeout=120):
+    """
+    Extract records from an API one at a time, without building a DataFrame.
+
+    Parameters:
+    - url (str): The URL of the API endpoint.
+    - api_key (str): The API key to use for authentication.
+    - params (dict): A dictionary containing the parameters to be passed to the API.
+    - timeout (int): The timeout in seconds for the API request.
+
+    Yields:
+    - record (dict): Each element of the JSON array returned by the API, or the returned object
+      itself when the endpoint does not return an array.
+
+    The function makes a GET request to the specified API endpoint (see _get_json), passing the
+    provided API key, parameters, and timeout, and yields the decoded records.
+
+    Example:
+    ```python
+    # Assuming url, api_key and params are defined
+    for record in pull_records_from_api(url, api_key, params):
+        print(record)
+    ```
+    """
+
+    payload = _get_json(url, api_key, params, timeout)
+
+    if isinstance(payload, list):
+        yield from payload
+    else:
+        # Endpoints such as /teams/matchup return a single object rather than an array.
+        yield payload
+
+
+def _compact(df):
+    """
+    Downcast numeric columns and convert low-cardinality string columns to categories, in place.
+
+    Parameters:
+    - df (pandas.DataFrame): The DataFrame to be compacted.
+
+    Returns:
+    - df (pandas.DataFrame): The same DataFrame, with smaller dtypes.
+
+    Integer columns are kept at int32 or wider, so that arithmetic on them (e.g. adding home and
+    away points) does not silently overflow. Float columns are only downcast when no precision is
+    lost, and object columns holding unhashable values (lists left by json_normalize) are left as
+    they are.
+    """
+
+    for c in df.select_dtypes("int64"):
+        if pd.to_numeric(df[c], downcast="integer").dtype.itemsize <= 4:
+            df[c] = df[c].astype("int32")
+    for c in df.select_dtypes("float64"):
+        downcast = pd.to_numeric(df[c], downcast="float")
+        if downcast.astype("float64").equals(df[c]):
+            df[c] = downcast
+    for c in df.select_dtypes(["object", "str"]):
+        try:
+            if df[c].nunique() / len(df) < 0.5:
+                df[c] = df[c].astype("category")
+        except TypeError:
+            continue
+    return df
+
 
 def pull_data_from_api(url, api_key, params, timeout=120):
     """
@@ -25,9 +197,10 @@ def pull_data_from_api(url, api_key, params, timeout=120):
     Returns:
     - df (pandas.DataFrame): The DataFrame containing the extracted data.
 
-    The function makes a GET request to the specified API endpoint, passing the provided API key,
-    parameters, and timeout. If the request is successful, the response is parsed as JSON,
-    and the JSON data is converted to a Pandas DataFrame. The DataFrame is returned.
+    The function makes a GET request to the specified API endpoint (see _get_json), passing the
+    provided API key, parameters, and timeout, and converts the decoded JSON to a Pandas DataFrame
+    with the smallest dtypes that fit the data. An endpoint that returns a single object gives a
+    one-row DataFrame. The DataFrame is returned.
 
     Example:
     ```python
@@ -39,27 +212,104 @@ def pull_data_from_api(url, api_key, params, timeout=120):
     The timeout parameter is optional and defaults to 120 seconds.
     """
 
-    headers = {"Accept": "application/json", "Authorization": f"Bearer {api_key}"}
+    df = pd.json_normalize(_get_json(url, api_key, params, timeout))
+    df.columns = df.columns.astype(str).str.upper()
+    return _compact(df)
 
-    response = requests.get(url, headers=headers, params=params, timeout=timeout)
 
-    if response.status_code == 200:
-        df = pd.json_normalize(response.json())
-        df.columns = map(str.upper, df.columns)
-        return df
-    else:
-        raise Exception(
-            f"Failed to fetch data from API. Status code: {response.status_code}"
+async def _fetch(session, url, api_key, timeout, params=None):
+    """
+    Asynchronously fetch JSON from an API endpoint using an httpx client.
+
+    Parameters:
+    - session (httpx.AsyncClient): The client to issue the request on.
+    - url (str): The URL of the API endpoint.
+    - api_key (str): The API key to use for authentication.
+    - timeout (int): The timeout in seconds for the API request.
+    - params (dict, optional): A dictionary containing the parameters to be passed to the API.
+
+    Returns:
+    - payload (list or dict): The decoded JSON response, parsed with orjson.
+    """
+
+    headers = _headers(api_key)
+
+    r = await session.get(url, headers=headers, params=params, timeout=timeout)
+    r.raise_for_status()
+    return orjson.loads(r.content)
+
+
+async def pull_many_async(args, api_key, timeout=120):
+    """
+    Fetch several categories from the College Football Data API concurrently.
+
+    Parameters:
+    - args (list): A list of argument dictionaries, each containing:
+        - "Category" (str): The category of data to retrieve from the API.
+        - "Search" (list): A list of search parameters for filtering the data.
+        - "Value" (list): A corresponding list of values for the search parameters.
+    - api_key (str): The API key for accessing the College Football Data API.
+    - timeout (int): The timeout in seconds for each API request.
+
+    Returns:
+    - dfs (list): A list of pandas.DataFrame objects, in the same order as args.
+
+    All requests are issued at once on a single HTTP/2 httpx client and gathered, so they are
+    multiplexed over a shared connection and the total wall time is close to that of the slowest
+    request rather than the sum of all of them.
+    JSON normalization and dtype compaction run in a worker thread so they do not block the
+    event loop.
+
+    Example:
+    ```python
+    args = [
+        {"Category": "teams", "Search": ["conference"], "Value": ["SEC"]},
+        {"Category": "games", "Search": ["year"], "Value": [2022]},
+    ]
+    teams_df, games_df = asyncio.run(pull_many_async(args, api_key))
+    ```
+    """
+
+    async with httpx.AsyncClient(
+        http2=True, limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+    ) as session:
+        payloads = await asyncio.gather(
+            *[
+                _fetch(
+                    session,
+                    BASE_URL + arg["Category"],
+                    api_key,
+                    timeout,
+                    params={
+                        s: str(v)
+                        for s, v in zip(arg.get("Search") or [], arg.get("Value") or [])
+                    },
+                )
+                for arg in args
+            ]
         )
 
+    def normalize(payload):
+        df = pd.json_normalize(payload)
+        df.columns = df.columns.astype(str).str.upper()
+        return _compact(df)
+
+    dfs = await asyncio.gather(
+        *[asyncio.to_thread(normalize, payload) for payload in payloads]
+    )
+    return list(dfs)
+
 
-def dump_to_csv(df, output_file):
+def dump_to_csv(df, output_file, use_arrow=True):
     """
     Dump a Pandas DataFrame to a CSV file.
 
     Parameters:
     - df (pandas.DataFrame): The DataFrame to be dumped to CSV.
     - output_file (str): The path to the output CSV file.
+    - use_arrow (bool): If True, write with PyArrow's multi-threaded CSV writer. If False, use
+      DataFrame.to_csv. Columns Arrow cannot write, such as lists (e.g. LOGOS from /teams) or
+      mixed-type values, make the function fall back to DataFrame.to_csv.
 
     The function writes the DataFrame to a CSV file using the provided output file path.
 
@@ -73,10 +323,90 @@ def dump_to_csv(df, output_file):
     This function assumes that the DataFrame has been cleaned and formatted correctly.
     """
 
+    if use_arrow:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            table = None
+
+        if table is not None and not any(
+            pa.types.is_nested(t.value_type if pa.types.is_dictionary(t) else t)
+            for t in table.schema.types
+        ):
+            pacsv.write_csv(
+                table,
+                output_file,
+                write_options=pacsv.WriteOptions(include_header=True),
+            )
+            return
+
     df.to_csv(output_file, index=False)
 
 
-def dump_to_postgres(df, connect_params, table_name):
+def dump_records_to_csv(records, output_file):
+    """
+    Dump an iterable of flat JSON records to a CSV file without building a DataFrame.
+
+    Parameters:
+    - records (iterable): An iterable of dictionaries, such as the output of pull_records_from_api.
+    - output_file (str): The path to the output CSV file.
+
+    The header is taken from the keys of the first record and the column names are upper-cased to
+    match pull_data_from_api. Keys missing from later records are written as empty fields and keys
+    not present in the first record are dropped.
+
+    Example:
+    ```python
+    # Assuming url, api_key, params and output_file are defined
+    dump_records_to_csv(pull_records_from_api(url, api_key, params), output_file)
+    ```
+
+    Note:
+    This function assumes that the records are flat. Nested objects are written as their Python repr;
+    use pull_data_from_api and dump_to_csv to flatten them instead.
+    """
+
+    records = iter(records)
+    first = next(records, None)
+
+    with open(output_file, "w", newline="") as f:
+        if first is None:
+            return
+        fieldnames = list(first)
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writerow({k: k.upper() for k in fieldnames})
+        writer.writerow(first)
+        writer.writerows(records)
+
+
+def psql_insert_copy(table, conn, keys, data_iter):
+    """
+    Insert rows into PostgreSQL with COPY FROM STDIN, for use as the `method` of DataFrame.to_sql.
+
+    Parameters:
+    - table (pandas.io.sql.SQLTable): The table being written to.
+    - conn (sqlalchemy.engine.Connection): The connection used by to_sql.
+    - keys (list): The column names.
+    - data_iter (iterable): An iterable of row tuples to be inserted.
+
+    Each chunk is serialized to an in-memory CSV buffer and sent in a single COPY, instead of
+    one INSERT round-trip per row.
+    """
+
+    buf = io.StringIO()
+    csv.writer(buf).writerows(data_iter)
+    buf.seek(0)
+
+    columns = ", ".join(f'"{k}"' for k in keys)
+    table_name = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table_name} ({columns}) FROM STDIN WITH CSV", buf
+        )
+
+
+def dump_to_postgres(df, connect_params, table_name, use_adbc=True):
     """
     Dump a Pandas DataFrame to a PostgreSQL database.
 
@@ -84,9 +414,13 @@ def dump_to_postgres(df, connect_params, table_name):
     - df (pandas.DataFrame): The DataFrame to be dumped to PostgreSQL.
     - connect_params (dict): The connection parameters for the PostgreSQL database.
     - table_name (str): The name of the table to be created in PostgreSQL.
+    - use_adbc (bool): If True, convert the DataFrame to an Arrow table once and ingest it with the
+      ADBC PostgreSQL driver. If False, or if the DataFrame cannot be converted to Arrow (e.g.
+      mixed-type columns), use DataFrame.to_sql with COPY in chunks of 10,000 rows (see
+      psql_insert_copy).
 
     The function connects to PostgreSQL using the provided connection parameters, creates a table with the
-    provided table name, and inserts the DataFrame into the table.
+    provided table name, and inserts the DataFrame into the table, replacing any existing table.
 
     Example:
     ```python
@@ -98,13 +432,45 @@ def dump_to_postgres(df, connect_params, table_name):
     This function assumes that the DataFrame has been cleaned and formatted correctly.
     """
 
+    uri = f"postgresql://{connect_params['user']}:{connect_params['password']}@{connect_params['host']}:{connect_params['port']}/{connect_params['dbname']}"
+
+    if use_adbc:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            table = None
+
+        if table is not None:
+            import adbc_driver_postgresql.dbapi as pg
+
+            # Category columns arrive as dictionary arrays, which are ingested as their plain values.
+            table = table.cast(
+                pa.schema(
+                    [
+                        f.with_type(f.type.value_type) if pa.types.is_dictionary(f.type) else f
+                        for f in table.schema
+                    ]
+                )
+            )
+
+            with pg.connect(uri) as conn:
+                with conn.cursor() as cursor:
+                    cursor.adbc_ingest(table_name, table, mode="replace")
+                conn.commit()
+            return
+
     from sqlalchemy import create_engine
 
-    engine = create_engine(
-        f"postgresql://{connect_params['user']}:{connect_params['password']}@{connect_params['host']}:{connect_params['port']}/{connect_params['dbname']}"
-    )
+    engine = create_engine(uri)
 
-    df.to_sql(table_name, engine, if_exists="replace")
+    df.to_sql(
+        table_name,
+        engine,
+        if_exists="replace",
+        index=False,
+        method=psql_insert_copy,
+        chunksize=10_000,
+    )
 
 
 def dump_to_bigquery(df, project_id, table_name):
@@ -116,8 +482,8 @@ def dump_to_bigquery(df, project_id, table_name):
     - project_id (str): The Google BigQuery project ID
     - table_name (str): The name of the table to be created in BigQuery, in the format dataset.tablename.
 
-    The function connects to BigQuery using the provided client, creates a table with the
-    provided table_name, and inserts the DataFrame into the table.
+    The function connects to BigQuery using the provided project ID and loads the DataFrame into the
+    table with the provided table_name as a single parquet batch load job, replacing any existing data.
 
     Example:
     ```python
@@ -129,7 +495,54 @@ def dump_to_bigquery(df, project_id, table_name):
     This function assumes that the DataFrame has been cleaned and formatted correctly.
     """
 
-    df.to_gbq(table_name, project_id, if_exists="replace")
+    from google.cloud import bigquery
+
+    client = bigquery.Client(project=project_id)
+    job_config = bigquery.LoadJobConfig(
+        write_disposition="WRITE_TRUNCATE",
+        source_format=bigquery.SourceFormat.PARQUET,
+    )
+
+    client.load_table_from_dataframe(df, table_name, job_config=job_config).result()
+
+
+_sf_conn = None
+_sf_conn_lock = threading.Lock()
+
+
+def _close_sf_conn():
+    if _sf_conn is not None and not _sf_conn.is_closed():
+        _sf_conn.close()
+
+
+atexit.register(_close_sf_conn)
+
+
+def _get_sf_conn(snowflake_conn):
+    """
+    Return the process-wide Snowflake connection, opening it on first use or if it was closed.
+
+    Parameters:
+    - snowflake_conn (dict): The connection parameters for Snowflake, passed to snowflake.connector.connect.
+
+    Returns:
+    - conn (snowflake.connector.SnowflakeConnection): The shared connection.
+
+    Note:
+    The connection parameters are only used when a new connection is opened, with
+    client_session_keep_alive enabled unless they set it. The connection is closed when the
+    interpreter exits.
+    """
+
+    global _sf_conn
+    with _sf_conn_lock:
+        if _sf_conn is None or _sf_conn.is_closed():
+            # Keep the session token refreshed so an idle connection in a long-lived worker does not
+            # fail with "Authentication token has expired" while is_closed() is still False.
+            _sf_conn = snowflake.connector.connect(
+                **{"client_session_keep_alive": True, **snowflake_conn}
+            )
+        return _sf_conn
 
 
 def dump_to_snowflake(df, snowflake_conn, table_name):
@@ -138,11 +551,16 @@ def dump_to_snowflake(df, snowflake_conn, table_name):
 
     Parameters:
     - df (pandas.DataFrame): The DataFrame to be dumped to Snowflake.
-    - snowflake_conn (sqlalchemy.engine.url.URL): The SQLAlchemy URL for the Snowflake connection.
+    - snowflake_conn (dict): The connection parameters for Snowflake, passed to snowflake.connector.connect.
     - table_name (str): The name of the table to be created in Snowflake.
 
-    The function connects to Snowflake using the provided SQLAlchemy URL, creates a table with the
-    provided table name, and inserts the DataFrame into the table.
+    The function connects to Snowflake using the provided connection parameters (reusing the
+    process-wide connection, see _get_sf_conn), creates a table with the
+    provided table name if it does not exist, and inserts the DataFrame into the table. The data is
+    staged as 100,000-row parquet chunks which are uploaded in parallel.
+
+    Returns:
+    - success (bool): True if the data was written successfully.
 
     Example:
     ```python
@@ -154,33 +572,91 @@ def dump_to_snowflake(df, snowflake_conn, table_name):
     This function assumes that the DataFrame has been cleaned and formatted correctly.
     """
 
-    conn = snowflake.connector.connect(
-        user=snowflake_conn.login,
-        password=snowflake_conn.password,
-        account=snowflake_conn.host,
-        warehouse=snowflake_conn.extra_dejson.get("warehouse"),
-        database=snowflake_conn.extra_dejson.get("database"),
-        schema=snowflake_conn.extra_dejson.get("schema"),
+    success, nchunks, nrows, _ = write_pandas(
+        _get_sf_conn(snowflake_conn),
+        df,
+        table_name,
+        auto_create_table=True,
+        chunk_size=100_000,
+        parallel=4,
+        compression="snappy",
     )
 
-    try:
-        with conn.cursor() as cursor:
+    return success
+
+
+def dump_json_to_snowflake(records, snowflake_conn, table_name, stage=None):
+    """
+    Load JSON records into Snowflake without converting them to a Pandas DataFrame.
+
+    Parameters:
+    - records (iterable): An iterable of dictionaries, such as the output of pull_records_from_api.
+    - snowflake_conn (dict): The connection parameters for Snowflake, passed to snowflake.connector.connect.
+    - table_name (str): The name of the existing Snowflake table to load the data into.
+    - stage (str, optional): The name of the stage to upload to. Defaults to the table stage.
+
+    Returns:
+    - success (bool): True if COPY INTO reports the staged file as LOADED.
+
+    The function writes the records to a temporary gzipped NDJSON file, uploads it to the stage
+    with PUT, and loads it with COPY INTO, so Snowflake parses the JSON server-side. Fields are
+    matched to table columns by name, case-insensitively. The staged file is purged after loading.
+
+    Example:
+    ```python
+    # Assuming url, api_key, params, snowflake_conn and table_name are defined
+    dump_json_to_snowflake(pull_records_from_api(url, api_key, params), snowflake_conn, table_name)
+    ```
+
+    Note:
+    This function assumes that the table already exists with columns named after the JSON fields.
+    """
+
+    if stage is None:
+        # The table stage of db.schema.table is db.schema.%table.
+        qualifier, _, name = table_name.rpartition(".")
+        stage = f"{qualifier}.%{name}" if qualifier else f"%{name}"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, f"{table_name}.json.gz")
+        with gzip.open(path, "wb") as f:
+            for record in records:
+                f.write(orjson.dumps(record))
+                f.write(b"\n")
+
+        with _get_sf_conn(snowflake_conn).cursor() as cursor:
             cursor.execute(
-                f"USE WAREHOUSE {snowflake_conn.extra_dejson.get('warehouse')}"
+                f"PUT file://{path} @{stage} AUTO_COMPRESS=FALSE SOURCE_COMPRESSION=GZIP OVERWRITE=TRUE"
             )
             cursor.execute(
-                f"USE DATABASE {snowflake_conn.extra_dejson.get('database')}"
+                f"COPY INTO {table_name} FROM @{stage} "
+                f"FILES=('{os.path.basename(path)}') "
+                "FILE_FORMAT=(TYPE=JSON COMPRESSION=GZIP) "
+                "MATCH_BY_COLUMN_NAME=CASE_INSENSITIVE PURGE=TRUE"
             )
-            cursor.execute(f"USE SCHEMA {snowflake_conn.extra_dejson.get('schema')}")
+            results = cursor.fetchall()
 
-            write_pandas(conn, df, table_name)
-            conn.commit()
+    # Each row is (file, status, ...); with no files processed a single message row is returned.
+    return bool(results) and all(len(r) > 1 and r[1] == "LOADED" for r in results)
 
-    finally:
-        conn.close()
 
+@functools.lru_cache(maxsize=1)
+def _snowflake_cfg():
+    """
+    Build the Snowflake connection parameters from the environment, once per process.
+    """
 
-def pull_and_dump_data(params, api_key, output):
+    return {
+        "user": os.getenv("SNOWFLAKE_USER"),
+        "password": os.getenv("SNOWFLAKE_PASS"),
+        "account": os.getenv("SNOWFLAKE_ACCT"),
+        "warehouse": os.getenv("SNOWFLAKE_WAREHOUSE"),
+        "database": os.getenv("SNOWFLAKE_DB"),
+        "schema": os.getenv("SNOWFLAKE_SCHEMA"),
+    }
+
+
+def pull_and_dump_data(arg, api_key, output=None):
     """
     Fetches data from the College Football Data API based on the provided arguments
     and optionally exports the data to Snowflake or saves it as a CSV file.
@@ -193,12 +669,16 @@ def pull_and_dump_data(params, api_key, output):
         - "Export" (bool, optional): If True, the data will be exported to Snowflake.
         - "Table" (str, optional): The name of the Snowflake table to export data to.
         - "File" (str): The base name for the CSV file if not exporting to Snowflake.
+        - "Raw" (bool, optional): If True, the JSON records are written to the CSV file or Snowflake
+          table directly, without building a DataFrame. The Snowflake table must already exist.
 
     - api_key (str): The API key for accessing the College Football Data API.
 
     Returns:
-    - str or bool: Returns 'Success' if the data is saved as a CSV file. Returns True if the data is
-                  successfully exported to Snowflake when the "Export" parameter is set to True.
+    - str or bool: Returns 'Success' if the data is saved as a CSV file. When the "Export" parameter
+                  is set to True, returns the result of dump_to_snowflake or dump_json_to_snowflake:
+                  True if the data was loaded, False otherwise (including when COPY INTO skipped a
+                  file Snowflake had already loaded).
 
     Example:
     ```python
@@ -216,33 +696,60 @@ def pull_and_dump_data(params, api_key, output):
     ```
     """
 
-    url = f'https://api.collegefootballdata.com/{arg["Category"]}'
-    if arg["Search"]:
-        for n, search in enumerate(arg["Search"]):
-            if n == 0:
-                url += f'?{search}={arg["Value"][n]}'
-            else:
-                url += f'&{search}={arg["Value"][n]}'
-    print(f"Query URL: {url}")
-    df = pull_data_from_api(url, api_key)
+    url = BASE_URL + arg["Category"]
+    params = dict(zip(arg["Search"] or [], arg["Value"] or []))
+    print(f"Query URL: {url} {params}")
+
+    if arg.get("Raw"):
+        records = pull_records_from_api(url, api_key, params=params)
+    else:
+        df = pull_data_from_api(url, api_key, params=params)
 
     if arg.get("Export"):
         print("Dumping to Snowflake...")
-        snowflake_conn = {
-            "login": os.getenv("SNOWFLAKE_USER"),
-            "password": os.getenv("SNOWFLAKE_PASS"),
-            "host": os.getenv("SNOWFLAKE_ACCT"),
-            "warehouse": os.getenv("SNOWFLAKE_WAREHOUSE"),
-            "database": os.getenv("SNOWFLAKE_DB"),
-            "schema": os.getenv("SNOWFLAKE_SCHEMA"),
-        }
+        snowflake_conn = _snowflake_cfg()
         table_name = arg.get("Table", "default_table_name")
-        dump_to_snowflake(df, snowflake_conn, table_name)
-        return True
+        if arg.get("Raw"):
+            return dump_json_to_snowflake(records, snowflake_conn, table_name)
+        return dump_to_snowflake(df, snowflake_conn, table_name)
 
-    df.to_csv(f'{arg["File"]}.csv')
+    if arg.get("Raw"):
+        dump_records_to_csv(records, f'{arg["File"]}.csv')
+    else:
+        dump_to_csv(df, f'{arg["File"]}.csv')
     return "Success"
 
 
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+
+
+async def pull_and_dump_data_async(arg, api_key):
+    """
+    Run pull_and_dump_data in a worker thread so it can be awaited from an event loop.
+
+    Parameters:
+    - arg (dict): A dictionary containing parameters for querying the API (see pull_and_dump_data).
+    - api_key (str): The API key for accessing the College Football Data API.
+
+    Returns:
+    - str or bool: The result of pull_and_dump_data.
+
+    Example:
+    ```python
+    results = await asyncio.gather(
+        *[pull_and_dump_data_async(arg, api_key) for arg in args]
+    )
+    ```
+
+    Note:
+    The API request and the CSV or database writes are still blocking; they run on a shared pool of
+    8 threads rather than on the event loop, so at most 8 pulls proceed at once.
+    """
+
+    return await asyncio.get_running_loop().run_in_executor(
+        _EXECUTOR, pull_and_dump_data, arg, api_key
+    )
+
+
 if __name__ == "__main__":
     print('My name is main')
@@ -0,0 +1,276 @@
+# test_pull_and_dump.py
+
+import http.server
+import json
+import threading
+
+import pandas as pd
+import pytest
+import requests
+
+from src.utils import pull_and_dump
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    routes = {}
+    hits = []
+
+    def do_GET(self):
+        self.hits.append(self.path)
+        if self.path.startswith("/unavailable"):
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps(self.routes[self.path.split("?")[0]]).encode()
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.send_header("ETag", '"v1"')
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api(tmp_path, monkeypatch):
+    monkeypatch.setattr(pull_and_dump, "CACHE_NAME", str(tmp_path / "cache"))
+    monkeypatch.setattr(pull_and_dump, "_SESSION", None)
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield _Handler.routes, f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    _Handler.routes.clear()
+    _Handler.hits.clear()
+
+
+def test_pull_same_url_twice_uses_cache(api):
+    routes, base = api
+    routes["/games"] = [{"id": 1, "home": "Alabama"}, {"id": 2, "home": "Auburn"}]
+
+    first = pull_and_dump.pull_data_from_api(f"{base}/games", "key", {"year": 2022})
+    second = pull_and_dump.pull_data_from_api(f"{base}/games", "key", {"year": 2022})
+
+    assert list(first.columns) == ["ID", "HOME"]
+    assert second.equals(first)
+    assert len(_Handler.hits) == 1
+
+
+def test_pull_raises_http_error_after_retries(api):
+    routes, base = api
+    session = pull_and_dump.get_session()
+    session.mount("http://", session.get_adapter("https://"))
+
+    with pytest.raises(requests.HTTPError):
+        pull_and_dump.pull_data_from_api(f"{base}/unavailable", "key", None)
+
+    assert len(_Handler.hits) == 4
+
+
+def test_pull_empty_result(api):
+    routes, base = api
+    routes["/games"] = []
+
+    df = pull_and_dump.pull_data_from_api(f"{base}/games", "key", {"year": 1800})
+
+    assert df.empty
+
+
+def test_pull_top_level_object(api):
+    routes, base = api
+    routes["/teams/matchup"] = {"team1": "Alabama", "team2": "Auburn", "games": []}
+
+    df = pull_and_dump.pull_data_from_api(f"{base}/teams/matchup", "key", None)
+
+    assert len(df) == 1
+    assert df.loc[0, "TEAM1"] == "Alabama"
+
+
+def test_compact_keeps_int_arithmetic_safe():
+    df = pd.DataFrame(
+        {
+            "HOME_POINTS": [70, 66, 10],
+            "AWAY_POINTS": [63, 65, 3],
+            "ID": [401403854, 401403855, 5_000_000_000],
+        }
+    )
+
+    pull_and_dump._compact(df)
+
+    assert df["HOME_POINTS"].dtype == "int32"
+    assert df["ID"].dtype == "int64"
+    assert (df["HOME_POINTS"] + df["AWAY_POINTS"]).tolist() == [133, 131, 13]
+
+
+def test_compact_only_downcasts_floats_without_precision_loss():
+    df = pd.DataFrame(
+        {
+            "SPREAD": [-3.5, 7.0, -3.5, 1.5],
+            "LAT": [33.2082752, 32.6025, 33.2082752, 30.0],
+        }
+    )
+
+    pull_and_dump._compact(df)
+
+    assert df["SPREAD"].dtype == "float32"
+    assert df["LAT"].dtype == "float64"
+
+
+def test_compact_categorizes_low_cardinality_strings():
+    df = pd.DataFrame(
+        {
+            "CONFERENCE": ["SEC", "SEC", "SEC", "SEC", "Big Ten"],
+            "SCHOOL": ["Alabama", "Auburn", "Georgia", "LSU", "Ohio State"],
+            "LOGOS": [["a.png"], ["b.png"], ["c.png"], ["d.png"], ["e.png"]],
+        }
+    )
+
+    pull_and_dump._compact(df)
+
+    assert df["CONFERENCE"].dtype == "category"
+    assert df["SCHOOL"].dtype != "category"
+    assert df["LOGOS"].dtype == object
+
+
+def test_dump_to_csv_with_list_column(tmp_path):
+    df = pd.DataFrame(
+        {"SCHOOL": ["Alabama", "Auburn"], "LOGOS": [["a.png", "b.png"], ["c.png"]]}
+    )
+    output_file = tmp_path / "teams.csv"
+
+    pull_and_dump.dump_to_csv(df, output_file)
+
+    written = pd.read_csv(output_file)
+    assert list(written.columns) == ["SCHOOL", "LOGOS"]
+    assert written.loc[1, "LOGOS"] == "['c.png']"
+
+
+def test_dump_to_csv_with_mixed_type_category(tmp_path):
+    df = pd.DataFrame({"ID": [1, 2, 3], "VALUE": ["SEC", 12, "SEC"]})
+    df["VALUE"] = df["VALUE"].astype("category")
+    output_file = tmp_path / "teams.csv"
+
+    pull_and_dump.dump_to_csv(df, output_file)
+
+    assert len(pd.read_csv(output_file)) == 3
+
+
+def test_dump_to_csv_with_arrow(tmp_path):
+    df = pd.DataFrame({"ID": [1, 2], "SCHOOL": pd.Categorical(["Alabama", "Auburn"])})
+    output_file = tmp_path / "teams.csv"
+
+    pull_and_dump.dump_to_csv(df, output_file)
+
+    written = pd.read_csv(output_file)
+    assert written["SCHOOL"].tolist() == ["Alabama", "Auburn"]
+
+
+def test_dump_to_postgres_falls_back_for_mixed_type_column(monkeypatch):
+    import sqlalchemy
+
+    calls = []
+    monkeypatch.setattr(sqlalchemy, "create_engine", lambda uri: uri)
+    monkeypatch.setattr(
+        pd.DataFrame, "to_sql", lambda self, *args, **kwargs: calls.append(kwargs)
+    )
+    df = pd.DataFrame({"ID": [1, 2, 3], "VALUE": ["SEC", 12, "SEC"]})
+    connect_params = {
+        "user": "u",
+        "password": "p",
+        "host": "localhost",
+        "port": 5432,
+        "dbname": "cfb",
+    }
+
+    pull_and_dump.dump_to_postgres(df, connect_params, "teams")
+
+    assert calls[0]["method"] is pull_and_dump.psql_insert_copy
+    assert calls[0]["index"] is False
+
+
+class _FakeCursor:
+    def __init__(self, results):
+        self.results = results
+        self.statements = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def execute(self, statement):
+        self.statements.append(statement)
+
+    def fetchall(self):
+        return self.results
+
+
+class _FakeConn:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self):
+        return self._cursor
+
+
+@pytest.mark.parametrize(
+    "table_name, stage",
+    [("GAMES", "@%GAMES"), ("CFB.RAW.GAMES", "@CFB.RAW.%GAMES")],
+)
+def test_dump_json_to_snowflake_table_stage(monkeypatch, table_name, stage):
+    cursor = _FakeCursor([("games.json.gz", "LOADED", 2, 2)])
+    monkeypatch.setattr(pull_and_dump, "_get_sf_conn", lambda cfg: _FakeConn(cursor))
+
+    assert pull_and_dump.dump_json_to_snowflake([{"id": 1}, {"id": 2}], {}, table_name)
+    assert f" {stage} " in cursor.statements[0]
+    assert f"FROM {stage} " in cursor.statements[1]
+
+
+def test_dump_json_to_snowflake_reports_failed_load(monkeypatch):
+    cursor = _FakeCursor([("games.json.gz", "LOAD_FAILED", 2, 0)])
+    monkeypatch.setattr(pull_and_dump, "_get_sf_conn", lambda cfg: _FakeConn(cursor))
+
+    assert not pull_and_dump.dump_json_to_snowflake([{"id": 1}], {}, "GAMES")
+
+
+def test_pull_and_dump_data_returns_snowflake_result(api, monkeypatch):
+    routes, base = api
+    routes["/games"] = [{"id": 1}]
+    monkeypatch.setattr(pull_and_dump, "BASE_URL", f"{base}/")
+    monkeypatch.setattr(pull_and_dump, "_snowflake_cfg", lambda: {})
+    cursor = _FakeCursor([("Copy executed with 0 files processed.",)])
+    monkeypatch.setattr(pull_and_dump, "_get_sf_conn", lambda cfg: _FakeConn(cursor))
+    arg = {"Category": "games", "Search": None, "Value": None, "Export": True, "Raw": True}
+
+    assert pull_and_dump.pull_and_dump_data(arg, "key") is False
+
+
+def test_get_sf_conn_keeps_session_alive(monkeypatch):
+    opened = []
+
+    class _Conn:
+        def is_closed(self):
+            return False
+
+    def connect(**kwargs):
+        opened.append(kwargs)
+        return _Conn()
+
+    monkeypatch.setattr(pull_and_dump.snowflake.connector, "connect", connect)
+    monkeypatch.setattr(pull_and_dump, "_sf_conn", None)
+
+    first = pull_and_dump._get_sf_conn({"user": "u"})
+    second = pull_and_dump._get_sf_conn({"user": "u"})
+
+    assert first is second
+    assert opened == [{"user": "u", "client_session_keep_alive": True}]